@@ -31,7 +31,6 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import numpy as np
-from scipy.fftpack import fft, ifft
 from axopy.features.util import nextpow2
 
 
@@ -52,6 +51,7 @@ def autocorrelation(x, axis):
     """
     x = np.asarray(x)
     m = x.shape[axis]
+    from scipy.fftpack import fft, ifft
     X = fft(x, n=nextpow2(m), axis=axis)
     R = np.real(ifft(np.abs(X)**2, axis=axis))  # Auto-correlation matrix
     R = R / (m-1)
@@ -7,7 +7,6 @@ Notation:
 """
 
 import numpy as np
-from scipy.stats import skew as sp_skewness, kurtosis as sp_kurtosis
 
 from axopy.features.util import (flatten_2d, check_output, rolling_window,
                                  inverted_t_window, trapezoidal_window)
@@ -480,6 +479,8 @@ def skewness(x, bias=True, nan_policy='propagate', axis=-1,
     y : ndarray, shape (n_channels,)
         skewness of each channel.
     """
+    # scipy.stats is slow to import, so only do it when needed
+    from scipy.stats import skew as sp_skewness
     skewness_ = sp_skewness(x, axis=axis, bias=bias,
                             nan_policy=nan_policy)
     return check_output(skewness_, axis=axis, keepdims=keepdims)
@@ -520,6 +521,7 @@ def kurtosis(x, fisher=True, bias=True, nan_policy='propagate', axis=-1,
     y : ndarray, shape (n_channels,)
         kurtosis of each channel.
     """
+    from scipy.stats import kurtosis as sp_kurtosis
     kurtosis_ = sp_kurtosis(x, axis=axis, fisher=fisher, bias=bias,
                             nan_policy=nan_policy)
     return check_output(kurtosis_, axis=axis, keepdims=keepdims)
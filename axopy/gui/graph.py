@@ -5,6 +5,41 @@ import numpy as np
 import pyqtgraph as pg
 from PyQt5.QtGui import QFont
 
+# cache of generated channel names, keyed by (n_names, prefix, start)
+_NAMES = {}
+
+
+def numbered_names(n_names, prefix='Ch ', start=1):
+    """
+    Numbered names for labeling channels in a plot.
+
+    Names are generated once for each combination of arguments and the same
+    (immutable) tuple is returned on subsequent calls.
+
+    Parameters
+    ----------
+    n_names : int
+        Number of names to generate.
+    prefix : str, optional
+        Text to prepend to each number. Default is ``'Ch '``.
+    start : int, optional
+        Number of the first name. Default is 1.
+
+    Returns
+    -------
+    names : tuple
+        Names ``prefix + str(i)`` for ``i`` from ``start`` to
+        ``start + n_names - 1``.
+    """
+    key = (n_names, prefix, start)
+    names = _NAMES.get(key)
+    if names is None:
+        names = tuple('{}{}'.format(prefix, i)
+                      for i in range(start, start + n_names))
+        _NAMES[key] = names
+    return names
+
+
 class SignalWidget(pg.GraphicsLayoutWidget):
     """
     Scrolling oscilloscope-like widget for displaying real-time signals.
@@ -177,8 +212,31 @@ class BarWidget(pg.PlotWidget):
 
             self._update_num_channels()
 
+        self.set_heights(data)
+
+    def set_heights(self, heights):
+        """
+        Sets the heights of all bars at once.
+
+        This is a faster alternative to :meth:`plot` for repeated updates with
+        data of the same shape. Each group's bars are updated from a column of
+        ``heights`` in a single call. If the shape of ``heights`` doesn't match
+        the current bars, :meth:`plot` is used to rebuild them.
+
+        Parameters
+        ----------
+        heights : ndarray, shape = (n_channels, n_groups) or (n_channels,)
+            Bar heights.
+        """
+        if heights.ndim == 1:
+            heights = heights[:, np.newaxis]
+
+        if heights.shape != (self.n_channels, self.n_groups):
+            self.plot(heights)
+            return
+
         for i, pdi in enumerate(self.plot_items):
-            pdi.setOpts(height=data[:, i])
+            pdi.setOpts(height=heights[:, i])
 
     def _update_num_channels(self):
         self.clear()
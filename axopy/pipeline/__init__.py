@@ -1,15 +1,36 @@
+"""Pipeline blocks for processing data.
+
+Array data passed between the blocks in this package is laid out in
+channel-major form: arrays have shape ``(n_channels, n_samples)`` and are
+C-contiguous, so the samples of each channel are adjacent in memory. This
+makes reductions over samples (``axis=-1``) operate on contiguous runs of
+memory rather than strided ones. :class:`Ensure2D` and :class:`Windower`
+always output arrays in this layout, so placing one of them at the start of a
+pipeline is enough to establish it for input from any device.
+"""
+
 from axopy.pipeline.core import Block, Pipeline
-from axopy.pipeline.common import (Passthrough, Callable, Windower, Centerer,
-                                   Filter, FeatureExtractor, Selector,
-                                   ChannelSelector, FeatureSelector, Estimator,
-                                   Transformer, Ensure2D, MinMaxScaler)
+from axopy.pipeline.common import (Passthrough, Callable, NumbaCallable,
+                                   UFunc, CircularStore, Windower, MeanWindow,
+                                   RunningRMS, RunningVar, GaussianModulator,
+                                   Centerer, Filter, FeatureExtractor,
+                                   Selector, ChannelSelector, FeatureSelector,
+                                   Estimator, Transformer, Ensure2D,
+                                   PlotDecimator, MinMaxScaler)
 from axopy.pipeline.sources import segment, segment_indices
 
 __all__ = ['Block',
            'Pipeline',
            'Passthrough',
            'Callable',
+           'NumbaCallable',
+           'UFunc',
+           'CircularStore',
            'Windower',
+           'MeanWindow',
+           'RunningRMS',
+           'RunningVar',
+           'GaussianModulator',
            'Centerer',
            'Filter',
            'FeatureExtractor',
@@ -19,6 +40,7 @@ __all__ = ['Block',
            'Estimator',
            'Transformer',
            'Ensure2D',
+           'PlotDecimator',
            'MinMaxScaler',
            'segment',
            'segment_indices']
@@ -2,7 +2,6 @@
 
 import warnings
 import numpy as np
-from scipy import signal
 
 from axopy.pipeline import Pipeline, Block
 
@@ -66,19 +65,249 @@ class Callable(Block):
     hooks : list, optional, default=None
         List of callables (callbacks) to run when after the block's `process`
         method is called.
+    dtype : numpy dtype, optional
+        If given, the output of `func` is converted to an array of this type
+        (without copying if it already is one). If None (default), the output
+        is returned as-is.
     """
 
     def __init__(self, func, func_args=None, func_kwargs=None, name=None,
-                 hooks=None):
+                 hooks=None, dtype=None):
         if name is None:
             name = func.__name__
         super(Callable, self).__init__(name=name, hooks=hooks)
         self.func = func
         self.func_args = func_args if func_args is not None else []
         self.func_kwargs = func_kwargs if func_kwargs is not None else {}
+        self.dtype = dtype
+
+    def process(self, data):
+        out = self.func(data, *self.func_args, **self.func_kwargs)
+        if self.dtype is not None:
+            out = np.asarray(out, dtype=self.dtype)
+        return out
+
+
+class NumbaCallable(Block):
+    """A `Block` that runs a kernel writing into a preallocated output.
+
+    This is similar to :class:`Callable`, but instead of returning a new array
+    on each call, the kernel writes its result into an output array that is
+    allocated once when the block is created. This avoids allocating
+    intermediate arrays on every update, which matters for real-time use. Some
+    kernels are provided in ``axopy.pipeline.kernels``, and they are
+    compiled with numba if it is installed.
+
+    Note that the same output array is returned on every call, so downstream
+    blocks should copy it if they need to keep previous results around.
+
+    Parameters
+    ----------
+    kernel : callable(x, *args, out)
+        Function that gets called when the block's `process` method is called.
+        Should take the input, any additional arguments and the output array
+        to write into.
+    out_shape : tuple
+        Shape of the output array.
+    func_args : list, optional
+        List (or tuple) of additional arguments to pass to `kernel` between
+        the input and the output array. If None (default), no arguments are
+        used.
+    dtype : numpy dtype, optional
+        Data type of the output array. Default is ``np.float64``.
+    name : str, optional, default=None
+        Name of the block. By default, the name of the `kernel` function is
+        used.
+    hooks : list, optional, default=None
+        List of callables (callbacks) to run when after the block's `process`
+        method is called.
+
+    Examples
+    --------
+    Compute the mean of each channel and multiply by 2:
+
+    >>> import numpy as np
+    >>> import axopy.pipeline as pipeline
+    >>> from axopy.pipeline.kernels import mean_scale
+    >>> block = pipeline.NumbaCallable(mean_scale, (2, 1), func_args=(2.,))
+    >>> block.process(np.array([[1., 2.], [3., 4.]]))
+    array([[ 3.],
+           [ 7.]])
+    """
+
+    def __init__(self, kernel, out_shape, func_args=None, dtype=np.float64,
+                 name=None, hooks=None):
+        if name is None:
+            name = kernel.__name__
+        super(NumbaCallable, self).__init__(name=name, hooks=hooks)
+        self.kernel = kernel
+        self.func_args = tuple(func_args) if func_args is not None else ()
+        self._out = np.empty(out_shape, dtype=dtype)
+
+    def process(self, data):
+        if data.shape[0] != self._out.shape[0]:
+            raise ValueError("Number of channels must match the output "
+                             "shape.")
+        self.kernel(data, *(self.func_args + (self._out,)))
+        return self._out
+
+
+class UFunc(Block):
+    """A `Block` that applies a NumPy ufunc in place.
+
+    The output array is allocated by the first call to `func`, then reused
+    on every subsequent call (via the ufunc's ``out`` argument) as long as the
+    shape and type of the input stay the same. This avoids allocating a new
+    array with each update when the pipeline runs at a high rate.
+
+    Note that the same output array is returned on every call, so downstream
+    blocks should copy it if they need to keep previous results around.
+
+    Parameters
+    ----------
+    func : numpy.ufunc
+        Function to apply, e.g. ``np.abs`` or ``np.sqrt``. It must accept an
+        ``out`` keyword argument.
+    name : str, optional, default=None
+        Name of the block. By default, the name of `func` is used.
+    hooks : list, optional, default=None
+        List of callables (callbacks) to run when after the block's `process`
+        method is called.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import axopy.pipeline as pipeline
+    >>> block = pipeline.UFunc(np.abs)
+    >>> block.process(np.array([[-1., 2.], [3., -4.]]))
+    array([[ 1.,  2.],
+           [ 3.,  4.]])
+    """
+
+    def __init__(self, func, name=None, hooks=None):
+        if name is None:
+            name = func.__name__
+        super(UFunc, self).__init__(name=name, hooks=hooks)
+        self.func = func
+
+        self.clear()
+
+    def clear(self):
+        """Clear the output array.
+        """
+        self._out = None
+        self._in_type = None
 
     def process(self, data):
-        return self.func(data, *self.func_args, **self.func_kwargs)
+        data = np.asarray(data)
+        in_type = (data.shape, data.dtype)
+        if self._out is None or in_type != self._in_type:
+            # 0-d input gives a scalar, which can't be written into later
+            self._out = np.asarray(self.func(data))
+            self._in_type = in_type
+        else:
+            self.func(data, out=self._out)
+        return self._out
+
+
+class CircularStore(object):
+    """Fixed-size circular buffer of multi-channel data.
+
+    This is the storage underlying :class:`Windower` and the running
+    statistic blocks (:class:`MeanWindow`, :class:`RunningRMS`,
+    :class:`RunningVar`). The buffer is allocated once and new samples
+    overwrite the oldest ones in place, so nothing is reallocated or shifted
+    as data comes in.
+
+    Parameters
+    ----------
+    n_channels : int
+        Number of channels (rows) in the buffer.
+    length : int
+        Number of samples stored per channel.
+    dtype : numpy dtype, optional
+        Data type of the buffer. Default is ``np.float64``.
+
+    Attributes
+    ----------
+    buffer : ndarray, shape (n_channels, length)
+        The underlying buffer. The oldest sample is at index ``head``.
+    head : int
+        Index in the buffer where the next sample will be written.
+    """
+
+    def __init__(self, n_channels, length, dtype=np.float64):
+        self.buffer = np.zeros((n_channels, length), dtype=dtype)
+        self.head = 0
+
+    @property
+    def n_channels(self):
+        return self.buffer.shape[0]
+
+    @property
+    def length(self):
+        return self.buffer.shape[1]
+
+    def write(self, data, on_replace=None):
+        """Write new samples, overwriting the oldest ones.
+
+        Parameters
+        ----------
+        data : array, shape (n_channels, n_samples)
+            Samples to write. ``n_samples`` must be at most ``length``.
+        on_replace : callable(old, new), optional
+            Called before each contiguous piece of the buffer is overwritten,
+            with a view of the samples about to be replaced and the new
+            samples replacing them. There are at most two pieces per write.
+
+        Returns
+        -------
+        wrapped : bool
+            Whether the write reached the end of the buffer and wrapped around
+            to the start.
+        """
+        head = self.head
+        n = data.shape[1]
+        n_end = min(n, self.length - head)
+        spans = [(head, head+n_end, data[:, :n_end])]
+        if n_end < n:
+            spans.append((0, n-n_end, data[:, n_end:]))
+
+        for start, stop, new in spans:
+            old = self.buffer[:, start:stop]
+            if on_replace is not None:
+                on_replace(old, new)
+            np.copyto(old, new, casting='unsafe')
+
+        self.head = (head + n) % self.length
+        return self.head <= head
+
+    def segments(self):
+        """Get the contents of the buffer, oldest first, without copying.
+
+        Returns
+        -------
+        older, newer : array, shape (n_channels, n_i)
+            Views of the oldest and newest parts of the buffer. These are
+            invalidated by the next call to :meth:`write`.
+        """
+        return self.buffer[:, self.head:], self.buffer[:, :self.head]
+
+    def read(self):
+        """Get a contiguous copy of the buffer contents, oldest first."""
+        return np.concatenate(self.segments(), axis=1)
+
+
+def _check_window_input(data, length, store):
+    if data.ndim != 2:
+        raise ValueError("data must be 2-dimensional.")
+
+    if data.shape[1] > length:
+        raise ValueError("data must be shorter than window length.")
+
+    if store is not None and data.shape[0] != store.n_channels:
+        raise ValueError("Number of channels cannot change without "
+                         "calling clear first.")
 
 
 class Windower(Block):
@@ -97,6 +326,10 @@ class Windower(Block):
         Total number of samples to output on each iteration. This must be at
         least as large as the number of samples input to the windower on each
         iteration.
+    dtype : numpy dtype, optional
+        Data type of the window. Input is converted to this type as it's
+        added to the window. Default is ``np.float64``. For display purposes,
+        ``np.float32`` halves the memory needed for the window.
 
     See Also
     --------
@@ -129,16 +362,17 @@ class Windower(Block):
     array([[ 0.,  0.,  1.,  2.]])
     """
 
-    def __init__(self, length):
+    def __init__(self, length, dtype=np.float64):
         super(Windower, self).__init__()
         self.length = length
+        self.dtype = dtype
 
         self.clear()
 
     def clear(self):
         """Clear the buffer containing previous input data.
         """
-        self._out = None
+        self._store = None
 
     def process(self, data):
         """Add new data to the end of the window.
@@ -152,33 +386,262 @@ class Windower(Block):
         Returns
         -------
         out : array, shape (n_channels, length)
-            Output window with the input data at the end.
+            Output window with the input data at the end. The output is
+            always a new C-contiguous array.
         """
-        if data.ndim != 2:
-            raise ValueError("data must be 2-dimensional.")
+        _check_window_input(data, self.length, self._store)
 
-        n = data.shape[1]
+        if self._store is None:
+            self._store = CircularStore(data.shape[0], self.length,
+                                        dtype=self.dtype)
 
-        if n > self.length:
-            raise ValueError("data must be shorter than window length.")
+        self._store.write(data)
+        return self._store.read()
 
-        if self._out is None:
-            self._preallocate(data.shape[0])
+    def views(self):
+        """Get the current window without copying it.
 
-        if data.shape[0] != self._out.shape[0]:
+        The buffer backing the window is circular, so the window is made up of
+        two segments of the buffer. Concatenating them (oldest first) gives the
+        output of :meth:`process`. The views are invalidated by the next call
+        to :meth:`process`. A ``ValueError`` is raised if no data has been
+        processed since the block was created or cleared.
+
+        Returns
+        -------
+        older, newer : array, shape (n_channels, n_i)
+            Views of the oldest and newest parts of the window.
+        """
+        if self._store is None:
+            raise ValueError("No window to view until data is processed.")
+        return self._store.segments()
+
+
+class _RunningStat(Block):
+    """Base class for statistics over a sliding window.
+
+    Subclasses keep running sums over a :class:`CircularStore`, as described
+    in :class:`MeanWindow`. ``_recompute`` sets the sums from the whole window,
+    ``_update`` adjusts them for replaced samples and ``_output`` computes the
+    statistic from them.
+    """
+
+    def __init__(self, length):
+        super(_RunningStat, self).__init__()
+        self.length = length
+
+        self.clear()
+
+    def clear(self):
+        """Clear the buffer containing previous input data.
+        """
+        self._store = None
+
+    def process(self, data):
+        """Add new data to the window and compute the statistic.
+
+        Parameters
+        ----------
+        data : array, shape (n_channels, n_samples)
+            Input data. ``n_samples`` must be less than or equal to the
+            window ``length``.
+
+        Returns
+        -------
+        out : array, shape (n_channels, 1)
+            Statistic of each channel over the window.
+        """
+        _check_window_input(data, self.length, self._store)
+
+        if self._store is None:
+            self._store = CircularStore(data.shape[0], self.length)
+            self._recompute(self._store.buffer)
+
+        if self._store.write(data, on_replace=self._update):
+            self._recompute(self._store.buffer)
+
+        return self._output()[:, np.newaxis]
+
+    def _recompute(self, window):
+        raise NotImplementedError
+
+    def _update(self, old, new):
+        raise NotImplementedError
+
+    def _output(self):
+        raise NotImplementedError
+
+
+class MeanWindow(_RunningStat):
+    """Mean of each channel over a sliding window.
+
+    This gives the same output as a :class:`Windower` followed by taking the
+    mean of each row of the window, but the sum over the window is updated
+    with only the new samples (and the ones they replace) on each iteration,
+    so the cost of an update doesn't depend on the window length. The sum is
+    recomputed from the window contents whenever the buffer wraps around, so
+    rounding errors don't accumulate.
+
+    The input length may change on each iteration, but the ``MeanWindow``
+    must be cleared before the number of channels can change.
+
+    Parameters
+    ----------
+    length : int
+        Number of samples to average over. This must be at least as large as
+        the number of samples input on each iteration.
+    scale : float, optional
+        Factor the mean is multiplied by. Default is 1.
+
+    Examples
+    --------
+    >>> import axopy.pipeline as pipeline
+    >>> import numpy as np
+    >>> block = pipeline.MeanWindow(4)
+    >>> block.process(np.array([[1, 3], [4, 8]]))
+    array([[ 1.],
+           [ 3.]])
+    >>> block.process(np.array([[4, 4], [0, 0]]))
+    array([[ 3.],
+           [ 3.]])
+    """
+
+    def __init__(self, length, scale=1.):
+        self.scale = scale
+        super(MeanWindow, self).__init__(length)
+
+    def _recompute(self, window):
+        self._sum = window.sum(axis=1)
+
+    def _update(self, old, new):
+        self._sum -= old.sum(axis=1)
+        self._sum += new.sum(axis=1, dtype=np.float64)
+
+    def _output(self):
+        return self._sum * (self.scale / self.length)
+
+
+class RunningRMS(_RunningStat):
+    """Root mean square of each channel over a sliding window.
+
+    Equivalent to a :class:`Windower` followed by computing the RMS of each
+    row of the window (e.g. for EMG envelope estimation), but only the new
+    samples are processed on each iteration. See :class:`MeanWindow`.
+
+    Parameters
+    ----------
+    length : int
+        Number of samples in the window. This must be at least as large as
+        the number of samples input on each iteration.
+    """
+
+    def _recompute(self, window):
+        self._sumsq = np.einsum('ij,ij->i', window, window)
+
+    def _update(self, old, new):
+        self._sumsq -= np.einsum('ij,ij->i', old, old)
+        self._sumsq += np.einsum('ij,ij->i', new, new, dtype=np.float64)
+
+    def _output(self):
+        return np.sqrt(np.maximum(self._sumsq, 0) / self.length)
+
+
+class RunningVar(_RunningStat):
+    """Variance of each channel over a sliding window.
+
+    Equivalent to a :class:`Windower` followed by computing the (population)
+    variance of each row of the window, but only the new samples are
+    processed on each iteration. See :class:`MeanWindow`.
+
+    Parameters
+    ----------
+    length : int
+        Number of samples in the window. This must be at least as large as
+        the number of samples input on each iteration.
+    """
+
+    def _recompute(self, window):
+        self._sum = window.sum(axis=1)
+        self._sumsq = np.einsum('ij,ij->i', window, window)
+
+    def _update(self, old, new):
+        self._sum -= old.sum(axis=1)
+        self._sum += new.sum(axis=1, dtype=np.float64)
+        self._sumsq -= np.einsum('ij,ij->i', old, old)
+        self._sumsq += np.einsum('ij,ij->i', new, new, dtype=np.float64)
+
+    def _output(self):
+        # one-pass E[x^2] - E[x]^2 rather than a Welford update, which can't
+        # remove old samples as cheaply. The sums are accumulated in float64
+        # (even for float32 input) and recomputed on every wraparound, which
+        # keeps the cancellation error small for input with a large offset.
+        mean = self._sum / self.length
+        return np.maximum(self._sumsq / self.length - mean**2, 0)
+
+
+class GaussianModulator(Block):
+    """Generates Gaussian noise with amplitude given by the input.
+
+    Each channel of the output is standard normal noise multiplied by the
+    corresponding input value and a gain. The output array is allocated once
+    (on the first call after the block is created or cleared) and filled in
+    place on each call, so the same array is returned every time.
+
+    Parameters
+    ----------
+    n_samples : int
+        Number of noise samples to generate per channel on each iteration.
+    gain : float, optional
+        Gain applied to the noise. Default is 1.
+    dtype : numpy dtype, optional
+        Data type of the output, either ``np.float32`` (default) or
+        ``np.float64``.
+    seed : int, optional
+        Seed for the random number generator.
+    """
+
+    def __init__(self, n_samples, gain=1., dtype=np.float32, seed=None):
+        super(GaussianModulator, self).__init__()
+        self.n_samples = n_samples
+        self.gain = gain
+        self.dtype = dtype
+        self.rng = np.random.default_rng(seed)
+
+        self.clear()
+
+    def clear(self):
+        """Clear the output array.
+
+        This should be called before the number of channels changes.
+        """
+        self._out = None
+
+    def process(self, data):
+        """Generate noise modulated by the input.
+
+        Parameters
+        ----------
+        data : array, shape (n_channels, 1)
+            Amplitude of the noise for each channel.
+
+        Returns
+        -------
+        out : array, shape (n_channels, n_samples)
+            Modulated noise.
+        """
+        if self._out is None:
+            self._out = np.empty((data.shape[0], self.n_samples),
+                                 dtype=self.dtype)
+        elif data.shape[0] != self._out.shape[0]:
             raise ValueError("Number of channels cannot change without "
                              "calling clear first.")
 
-        if n == self.length:
-            self._out = data
-        else:
-            self._out[:, :self.length-n] = self._out[:, -(self.length-n):]
-            self._out[:, -n:] = data
-
-        return self._out.copy()
+        self.rng.standard_normal(out=self._out, dtype=self.dtype)
+        np.multiply(self._out, data, out=self._out)
+        if self.gain != 1:
+            self._out *= self.gain
 
-    def _preallocate(self, n_channels):
-        self._out = np.zeros((n_channels, self.length))
+        return self._out
 
 
 class Centerer(Block):
@@ -258,10 +721,15 @@ class Filter(Block):
 
     def __init__(self, b, a=1, overlap=0):
         super(Filter, self).__init__()
-        self.b = b
+        self.b = np.atleast_1d(b)
         self.a = np.atleast_1d(a)
         self.overlap = overlap
 
+        # normalize the coefficients once rather than on every lfilter call
+        self._b = self.b / self.a[0]
+        self._a = self.a / self.a[0]
+        self._fir = len(self._a) == 1
+
         self.clear()
 
     def clear(self):
@@ -272,6 +740,7 @@ class Filter(Block):
         """
         self._x_prev = None
         self._y_prev = None
+        self._zi = None
 
     def process(self, data):
         """Applies the filter to the input.
@@ -284,28 +753,54 @@ class Filter(Block):
         if data.ndim != 2:
             raise ValueError("data must be 2-dimensional.")
 
-        if self._x_prev is None:
-            # first pass has no initial conditions
-            out = signal.lfilter(self.b, self.a, data, axis=-1)
-        else:
-            # subsequent passes get ICs from previous input/output
-            num_ch = data.shape[0]
-            K = max(len(self.a)-1, len(self.b)-1)
-            self._zi = np.zeros((num_ch, K))
+        if self._fir:
+            return self._process_fir(data)
+
+        # scipy.signal is imported here rather than at the module level so
+        # that pipelines without filters don't pay for importing scipy
+        from scipy import signal
 
-            # unfortunately we have to get zi channel by channel
+        K = max(len(self._a), len(self._b)) - 1
+        if self._zi is None:
+            # first pass has no initial conditions
+            self._zi = np.zeros((data.shape[0], K))
+        elif self.overlap > 0:
+            # ICs come from the previous input/output preceding the overlap,
+            # unfortunately we have to get them channel by channel
             for c in range(data.shape[0]):
                 self._zi[c, :] = signal.lfiltic(
-                    self.b,
-                    self.a,
+                    self._b,
+                    self._a,
                     self._y_prev[c, -(self.overlap+1)::-1],
                     self._x_prev[c, -(self.overlap+1)::-1])
 
-            out, zf = signal.lfilter(self.b, self.a, data, axis=-1,
-                                     zi=self._zi)
+        out, zf = signal.lfilter(self._b, self._a, data, axis=-1,
+                                 zi=self._zi)
 
-        self._x_prev = data
-        self._y_prev = out
+        if self.overlap == 0:
+            # final conditions carry straight over to the next input
+            self._zi = zf
+        else:
+            self._x_prev = data
+            self._y_prev = out
+
+        return out
+
+    def _process_fir(self, data):
+        from scipy import signal
+
+        # the FIR output only depends on the past len(b)-1 inputs, so keep
+        # those around and convolve them along with the new input
+        K = len(self._b) - 1
+        if self._x_prev is None:
+            self._x_prev = np.zeros((data.shape[0], K))
+
+        x = np.concatenate((self._x_prev, data), axis=1)
+        out = signal.oaconvolve(x, self._b[np.newaxis, :], mode='valid',
+                                axes=-1)
+
+        # history for the next input excludes the samples it will repeat
+        self._x_prev = x[:, x.shape[1]-self.overlap-K:x.shape[1]-self.overlap]
 
         return out
 
@@ -640,6 +1135,10 @@ class Ensure2D(Block):
         behavior, useful when the data is something like samples of a 1-channel
         signal.  If 'col', the output will have shape ``(n, 1)``, meaning the
         output is a column vector.
+    dtype : numpy dtype, optional
+        If given, the output is converted to this type, e.g. ``np.float32`` to
+        reduce the size of data from a device early in a pipeline. If None
+        (default), the input type is kept.
 
     Examples
     --------
@@ -660,9 +1159,10 @@ class Ensure2D(Block):
            [3]])
     """
 
-    def __init__(self, orientation='row'):
+    def __init__(self, orientation='row', dtype=None):
         super(Ensure2D, self).__init__()
         self.orientation = orientation
+        self.dtype = dtype
 
         if orientation not in ['row', 'col']:
             raise ValueError("orientation must be either 'row' or 'col'")
@@ -680,14 +1180,62 @@ class Ensure2D(Block):
         Returns
         -------
         out : array, shape (1, n) or (n, 1)
-            Output data, with shape specified by ``orientation``.
+            Output data, with shape specified by ``orientation``. The output is
+            always C-contiguous.
         """
         data = np.atleast_2d(data)
 
-        if self.orientation == 'row':
-            return data
-        else:
-            return data.T
+        if self.orientation == 'col':
+            data = data.T
+
+        # make sure downstream blocks see contiguous channel-major data
+        return np.ascontiguousarray(data, dtype=self.dtype)
+
+
+class PlotDecimator(Block):
+    """Reduces the number of samples in a window for display.
+
+    Keeps every ``k``-th sample of the input, with ``k`` chosen so that the
+    output has at most ``target_points`` samples. The output is a view
+    of the input, so no data is copied. This is meant to go at the end of a
+    pipeline feeding a plot, where there's no use in drawing many more points
+    than there are pixels on the screen. No anti-aliasing filter is applied,
+    so it shouldn't be used ahead of further processing.
+
+    Parameters
+    ----------
+    target_points : int, optional
+        Maximum number of samples to output. Default is 2000.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import axopy.pipeline as pipeline
+    >>> block = pipeline.PlotDecimator(target_points=3)
+    >>> block.process(np.arange(10).reshape(1, -1))
+    array([[0, 4, 8]])
+    """
+
+    def __init__(self, target_points=2000):
+        super(PlotDecimator, self).__init__()
+        self.target_points = target_points
+
+    def process(self, data):
+        """Decimate the input.
+
+        Parameters
+        ----------
+        data : array, shape (n_channels, n_samples)
+            Input data.
+
+        Returns
+        -------
+        out : array, shape (n_channels, n_samples_out)
+            View of every ``k``-th sample of the input.
+        """
+        # round the step up so the output never exceeds target_points
+        step = max(1, -(-data.shape[-1] // self.target_points))
+        return data[..., ::step]
 
 
 class MinMaxScaler(Block):
@@ -78,15 +78,32 @@ class Pipeline(Block):
     named_blocks : dict
         Dictionary of blocks in the pipeline. Keys are the names given to the
         blocks in the pipeline and values are the block objects.
+
+    Notes
+    -----
+    The block structure is converted to a chain of function calls when
+    ``blocks`` is set, so ``process`` doesn't need to inspect the structure
+    on every call. The pipeline keeps its own copy of the structure, so to
+    change it, assign a new structure to ``blocks``.
     """
 
     def __init__(self, blocks, name=None):
         super(Pipeline, self).__init__(name=name)
         self.blocks = blocks
+
+    @property
+    def blocks(self):
+        return _copy_structure(self._blocks)
+
+    @blocks.setter
+    def blocks(self, blocks):
+        self._blocks = _copy_structure(blocks)
         self.named_blocks = {}
 
         # traverse the block structure to fill named_blocks
-        self._call_block('name', self.blocks)
+        self._call_block('name', self._blocks)
+
+        self._process = self._compile(self._blocks)
 
     def process(self, data):
         """
@@ -105,15 +122,62 @@ class Pipeline(Block):
             The data output by the ``process`` method of the last block(s) in
             the pipeline.
         """
-        out = self._call_block('process', self.blocks, data)
-        return out
+        return self._process(data)
+
+    def __getstate__(self):
+        # the compiled chain holds closures, which can't be pickled and
+        # would refer to the original blocks in a deep copy
+        state = self.__dict__.copy()
+        del state['_process']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._process = self._compile(self._blocks)
 
     def clear(self):
         """
         Calls the ``clear`` method on each block in the pipeline. The effect
         depends on the blocks themselves.
         """
-        self._call_block('clear', self.blocks)
+        self._call_block('clear', self._blocks)
+
+    def _compile(self, block):
+        # build a function equivalent to calling the blocks' process methods
+        # as specified by the block structure
+        if isinstance(block, list):
+            funcs = tuple(self._compile(b) for b in block)
+            if len(funcs) == 1:
+                return funcs[0]
+
+            def process_list(data):
+                for f in funcs:
+                    data = f(data)
+                return data
+
+            return process_list
+        elif isinstance(block, tuple):
+            funcs = tuple(self._compile(b) for b in block)
+
+            def process_tuple(data):
+                return [f(data) for f in funcs]
+
+            return process_tuple
+        else:
+            f = block.process
+            if not hasattr(block, 'hooks'):
+                return f
+
+            # the hooks list is read on every call so hooks added later run
+            hooks = block.hooks
+
+            def process_hooks(data):
+                out = f(data)
+                for hook in hooks:
+                    hook(out)
+                return out
+
+            return process_hooks
 
     def _call_block(self, fname, block, data=None):
         if isinstance(block, list):
@@ -153,3 +217,12 @@ class Pipeline(Block):
             return out
         else:
             return None
+
+
+def _copy_structure(block):
+    # copy the lists and tuples of a block structure, keeping the blocks
+    if isinstance(block, list):
+        return [_copy_structure(b) for b in block]
+    elif isinstance(block, tuple):
+        return tuple(_copy_structure(b) for b in block)
+    return block
@@ -0,0 +1,106 @@
+"""Fused kernels for per-update array processing.
+
+Each kernel takes an input array followed by any parameters and writes its
+result into a preallocated ``out`` array (the last argument), so no
+intermediate arrays are created per update. They are meant to be used with
+:class:`axopy.pipeline.NumbaCallable`. If numba_ is installed, the kernels
+are compiled to machine code the first time they're called. Otherwise,
+equivalent NumPy implementations are used.
+
+.. _numba: https://numba.pydata.org/
+"""
+
+import functools
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+def _check_channels(x, out):
+    # the compiled loops don't check bounds, so mismatched shapes have to be
+    # caught before writing into out
+    if x.ndim != 2 or out.ndim != 2:
+        raise ValueError("x and out must be 2-dimensional.")
+    if x.shape[0] != out.shape[0]:
+        raise ValueError("x and out must have the same number of channels.")
+
+
+def _check_same_shape(x, out):
+    _check_channels(x, out)
+    if x.shape[1] != out.shape[1]:
+        raise ValueError("x and out must have the same shape.")
+
+
+def mean_scale(x, gain, out):
+    """Mean of each row of ``x``, multiplied by ``gain``.
+
+    ``out`` must have shape ``(n_channels, 1)``.
+    """
+    _check_channels(x, out)
+    if out.shape[1] != 1:
+        raise ValueError("out must have one sample per channel.")
+    n_samples = x.shape[1]
+    for i in range(x.shape[0]):
+        s = 0.0
+        for j in range(n_samples):
+            s += x[i, j]
+        out[i, 0] = gain * s / n_samples
+
+
+def absolute(x, out):
+    """Element-wise absolute value of ``x``.
+
+    ``out`` must have the same shape as ``x``.
+    """
+    _check_same_shape(x, out)
+    for i in range(x.shape[0]):
+        for j in range(x.shape[1]):
+            out[i, j] = abs(x[i, j])
+
+
+def mean_noise(x, gain, out):
+    """Gaussian noise modulated by the scaled mean of ``x``.
+
+    Each row of ``out`` is filled with standard normal samples multiplied by
+    ``gain`` times the mean of the corresponding row of ``x``. ``out`` has
+    shape ``(n_channels, n_samples)``, where ``n_samples`` is the number of
+    noise samples to generate.
+    """
+    _check_channels(x, out)
+    n_samples = x.shape[1]
+    for i in range(x.shape[0]):
+        s = 0.0
+        for j in range(n_samples):
+            s += x[i, j]
+        amp = gain * s / n_samples
+        for j in range(out.shape[1]):
+            out[i, j] = amp * np.random.standard_normal()
+
+
+if numba is not None:
+    _jit = numba.njit(cache=True, fastmath=True)
+    _check_channels = _jit(_check_channels)
+    _check_same_shape = _jit(_check_same_shape)
+    mean_scale = _jit(mean_scale)
+    absolute = _jit(absolute)
+    mean_noise = _jit(mean_noise)
+else:
+    @functools.wraps(mean_scale)
+    def mean_scale(x, gain, out):
+        _check_channels(x, out)
+        np.mean(x, axis=1, keepdims=True, out=out)
+        out *= gain
+
+    @functools.wraps(absolute)
+    def absolute(x, out):
+        _check_same_shape(x, out)
+        np.abs(x, out=out)
+
+    @functools.wraps(mean_noise)
+    def mean_noise(x, gain, out):
+        _check_channels(x, out)
+        out[:] = np.random.standard_normal(out.shape)
+        out *= gain * np.mean(x, axis=1, keepdims=True)
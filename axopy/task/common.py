@@ -1,5 +1,6 @@
 """Some generic task implementations."""
 
+import time
 from axopy.task import Task
 from axopy import util
 from axopy.gui.graph import SignalWidget, BarWidget, PolarWidget
@@ -51,18 +52,39 @@ class Oscilloscope(_Visualizer):
         view of the input data, which can be helpful for experiment setup (e.g.
         placing electrodes, making sure the device is recording properly,
         etc.).
+    max_rate : float, optional
+        Maximum rate (in Hz) at which the plot is redrawn. Input data is still
+        run through the pipeline on every update, but the plot is only
+        redrawn if at least ``1/max_rate`` seconds have passed since it was
+        last drawn. If None, the plot is redrawn on every update. Default is
+        30.
     kwargs : key, value mappings
         Other keyword arguments are passed through to SignalWidget.
     """
 
-    def __init__(self, pipeline=None, **kwargs):
+    def __init__(self, pipeline=None, max_rate=30., **kwargs):
         super(Oscilloscope, self).__init__(pipeline=pipeline)
+        self.max_rate = max_rate
         self.kwargs = kwargs
+        self._last_plot_time = None
 
     def prepare_graphics(self, container):
         self.scope = SignalWidget(**self.kwargs)
         container.set_widget(self.scope)
 
+    def update(self, data):
+        if self.pipeline is not None:
+            data = self.pipeline.process(data)
+
+        if self.max_rate is not None:
+            now = time.perf_counter()
+            if (self._last_plot_time is not None and
+                    now - self._last_plot_time < 1. / self.max_rate):
+                return
+            self._last_plot_time = now
+
+        self.scope.plot(data)
+
 
 class BarPlotter(_Visualizer):
     """A bar plot visualizer.
@@ -93,6 +115,11 @@ class BarPlotter(_Visualizer):
         self.scope = BarWidget(**self.kwargs)
         container.set_widget(self.scope)
 
+    def update(self, data):
+        if self.pipeline is not None:
+            data = self.pipeline.process(data)
+        self.scope.set_heights(data)
+
 
 class PolarPlotter(_Visualizer):
     """ A polar plot visualizer.
@@ -1,7 +1,6 @@
 """Some commonly used EMG task implementations."""
 
 import numpy as np
-from scipy.signal import butter
 from PyQt5.QtWidgets import QDesktopWidget, QMessageBox
 from axopy.task import Task
 from axopy.gui.emg import EnvelopeCalibrationWidget
@@ -215,6 +214,7 @@ class EnvelopeCalibration(Task):
             raise ValueError(
                 "Invalid or not supported filter type {}.".format(type))
 
+        from scipy.signal import butter
         b, a = butter(N=self.filter_order, Wn=Wn, btype=self.filter_type)
         filter = Filter(b, a, overlap=(int(self.rate * win_size) -
                                        int(self.rate * self.read_length)))
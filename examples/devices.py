@@ -13,6 +13,9 @@ bar
     temporally filtered data.
 polar
     Basic use of a RandomWalkGenerator to with a polar plot.
+sequence
+    Several visualization tasks run one after the other in a single
+    experiment, sharing the same device and Qt application.
 keyboard
     Basic use of a Keyboard to show roughly-timed keyboard inputs.
 keystick
@@ -57,28 +60,28 @@ import argparse
 import numpy as np
 from axopy.task import Oscilloscope, BarPlotter, PolarPlotter
 from axopy.experiment import Experiment
+from axopy.gui.graph import numbered_names
 from axopy.daq import NoiseGenerator, RandomWalkGenerator, Keyboard, Mouse
-from axopy.pipeline import Pipeline, Callable, Windower
+from axopy.pipeline import (Pipeline, Callable, UFunc, Windower, MeanWindow,
+                            GaussianModulator, PlotDecimator)
 
 
 def rainbow():
     num_channels = 16
     dev = NoiseGenerator(rate=2000, num_channels=num_channels, read_size=200)
-    channel_names = ['Ch ' + str(i) for i in range(1, num_channels+1)]
+    channel_names = numbered_names(num_channels)
     run(dev, channel_names=channel_names)
 
 
 def bar():
     num_channels = 10
-    channel_names = ['Ch ' + str(i) for i in range(1, num_channels+1)]
+    channel_names = numbered_names(num_channels)
     dev = NoiseGenerator(
         rate=100,
         num_channels=num_channels,
         amplitude=5.0,
         read_size=10)
-    pipeline = Pipeline([
-        Windower(100),
-        Callable(lambda x: np.mean(x, axis=1, keepdims=True))])
+    pipeline = Pipeline([MeanWindow(100)])
     Experiment(daq=dev, subject='test').run(BarPlotter(
         pipeline=pipeline, channel_names=channel_names,
         group_colors=[[255, 204, 204]], yrange=(-0.5, 0.5)))
@@ -92,16 +95,28 @@ def polar():
         amplitude=0.03,
         read_size=1)
     # Polar plot can only show non-negative values
-    pipeline = Pipeline([Callable(lambda x: np.abs(x))])
+    pipeline = Pipeline([UFunc(np.abs)])
     Experiment(daq=dev, subject='test').run(PolarPlotter(
         pipeline, color=[0, 128, 255], fill=True, n_circles=10, max_value=5.))
 
 
+def sequence():
+    num_channels = 4
+    channel_names = numbered_names(num_channels)
+    dev = NoiseGenerator(rate=1000, num_channels=num_channels, read_size=50)
+    run_many(dev, [
+        Oscilloscope(Pipeline([Windower(2000, dtype=np.float32)]),
+                     channel_names=channel_names),
+        BarPlotter(Pipeline([MeanWindow(500)]), channel_names=channel_names,
+                   yrange=(-0.5, 0.5)),
+    ])
+
+
 def keyboard():
     keys = list('wasd')
     dev = Keyboard(keys=keys)
     # need a windower to show something interesting in the oscilloscope
-    pipeline = Pipeline([Windower(10)])
+    pipeline = Pipeline([Windower(10, dtype=np.float32)])
     run(dev, pipeline, channel_names=keys)
 
 
@@ -109,12 +124,10 @@ def keystick():
     keys = list('wasd')
     dev = Keyboard(rate=20, keys=keys)
     pipeline = Pipeline([
-        # window to average over
-        Windower(10),
-        # mean along rows
-        Callable(lambda x: np.mean(x, axis=1, keepdims=True)),
+        # mean along rows over a short window
+        MeanWindow(10),
         # window to show in the oscilloscope
-        Windower(60)
+        Windower(60, dtype=np.float32)
     ])
     run(dev, pipeline, channel_names=keys)
 
@@ -125,7 +138,7 @@ def mouse():
         # just for scaling the input since it's in pixels
         Callable(lambda x: x/100),
         # window to show in the oscilloscope
-        Windower(40)
+        Windower(40, dtype=np.float32)
     ])
     channel_names = list('xy')
     run(dev, pipeline, channel_names=channel_names)
@@ -145,15 +158,13 @@ def emgsim():
     samp_per_input = int(fs / update_rate)
 
     pipeline = Pipeline([
-        # get keyboard inputs of past second
-        Windower(update_rate),
-        # take mean over last second and apply a gain
-        Callable(lambda x: np.mean(x, axis=1, keepdims=True)),
-        # generate noise with amplitude of previous output
-        Callable(lambda x, k: gain * x * np.random.randn(x.shape[0], k),
-                 func_args=(samp_per_input,)),
+        # mean of keyboard inputs over the past second
+        MeanWindow(update_rate),
+        # generate noise with amplitude of previous output and apply a gain
+        GaussianModulator(samp_per_input, gain=gain),
         # window for pretty display in oscilloscope
-        Windower(osc_view_time * update_rate * samp_per_input),
+        Windower(osc_view_time * update_rate * samp_per_input,
+                 dtype=np.float32),
     ])
 
     dev = Keyboard(rate=update_rate, keys=keys)
@@ -169,8 +180,8 @@ def trignoemg():
         zero_based=False,
         units='normalized',
         data_port=50043)
-    pipeline = Pipeline([Windower(20000)])
-    channel_names = ['EMG ' + str(i) for i in range(1, n_channels+1)]
+    pipeline = Pipeline([Windower(20000, dtype=np.float32), PlotDecimator()])
+    channel_names = numbered_names(n_channels, prefix='EMG ')
     run(dev, pipeline, channel_names=channel_names)
 
 
@@ -182,7 +193,7 @@ def trignoacc():
         samples_per_read=12,
         data_port=50042,
         zero_based=False)
-    pipeline = Pipeline([Windower(1200)])
+    pipeline = Pipeline([Windower(1200, dtype=np.float32)])
     channel_names = ['Acc ' + str(i) + '_' + axis for i in
                      range(1, n_channels+1) for axis in ['x', 'y', 'z']]
     run(dev, pipeline, channel_names=channel_names)
@@ -197,7 +208,7 @@ def trignoimu():
         imu_mode='raw',
         data_port=50044,
         zero_based=False)
-    pipeline = Pipeline([Windower(1200)])
+    pipeline = Pipeline([Windower(1200, dtype=np.float32)])
     channel_names = [mod + '_' + str(i) + '_' + axis
                      for i in range(1, n_channels+1)
                      for mod in ['Acc', 'Gyro', 'Mag']
@@ -215,7 +226,7 @@ def quattroemg():
         mode=313,
         units='normalized',
         data_port=50043)
-    pipeline = Pipeline([Windower(20000)])
+    pipeline = Pipeline([Windower(20000, dtype=np.float32)])
     channel_names = [str(i) + channel for i in range(1, n_sensors + 1)
                      for channel in ['A', 'B', 'C', 'D']]
     run(dev, pipeline, channel_names=channel_names)
@@ -230,7 +241,7 @@ def quattroimu():
         data_port=50044,
         mode=313,
         zero_based=False)
-    pipeline = Pipeline([Windower(1200)])
+    pipeline = Pipeline([Windower(1200, dtype=np.float32)])
     channel_names = [str(i) + '_' + axis for i in range(1, n_sensors + 1)
                      for axis in ['a', 'b', 'c', 'd']]
     run(dev, pipeline, channel_names=channel_names)
@@ -243,8 +254,8 @@ def myoemg():
     myo.init(sdk_path=r'C:\Users\nak142\Coding\myo-python\myo-sdk-win-0.9.0')
     n_channels = 8
     dev = MyoEMG(channels=range(n_channels), samples_per_read=20)
-    pipeline = Pipeline([Windower(2000)])
-    channel_names = ['EMG ' + str(i) for i in range(1, n_channels+1)]
+    pipeline = Pipeline([Windower(2000, dtype=np.float32), PlotDecimator()])
+    channel_names = numbered_names(n_channels, prefix='EMG ')
     run(dev, pipeline, channel_names=channel_names, yrange=(-150, 150))
 
 
@@ -253,7 +264,7 @@ def myoimu():
     from pydaqs.myo import MyoIMU
     myo.init(sdk_path=r'C:\Users\nak142\Coding\myo-python\myo-sdk-win-0.9.0')
     dev = MyoIMU(samples_per_read=5)
-    pipeline = Pipeline([Windower(500)])
+    pipeline = Pipeline([Windower(500, dtype=np.float32)])
     channel_names = list('wxyz')
     run(dev, pipeline, channel_names=channel_names)
 
@@ -266,8 +277,8 @@ def nidaq():
         samples_per_read=200,
         rate=2000,
         zero_based=False)
-    pipeline = Pipeline([Windower(20000)])
-    channel_names = ['EMG ' + str(i) for i in range(1, n_channels+1)]
+    pipeline = Pipeline([Windower(20000, dtype=np.float32), PlotDecimator()])
+    channel_names = numbered_names(n_channels, prefix='EMG ')
     run(dev, pipeline, channel_names=channel_names)
 
 
@@ -280,7 +291,7 @@ def arduino():
         pins=pins,
         samples_per_read=10,
         zero_based=True)
-    pipeline = Pipeline([Windower(10000)])
+    pipeline = Pipeline([Windower(10000, dtype=np.float32)])
     channel_names = ['A ' + str(i) for i in pins]
     run(dev, pipeline, channel_names=channel_names, yrange=(0, 1))
 
@@ -292,8 +303,8 @@ def blackrock():
     # Needed to avoid having Cerelink create the QCoreApplication
     _ = get_qtapp()
     dev = Blackrock(channels=range(1, n_channels + 1), samples_per_read=20)
-    pipeline = Pipeline([Windower(5000)])
-    channel_names = ['EMG ' + str(i) for i in range(1, n_channels+1)]
+    pipeline = Pipeline([Windower(5000, dtype=np.float32)])
+    channel_names = numbered_names(n_channels, prefix='EMG ')
     run(dev, pipeline, channel_names=channel_names, yrange=(-1000, 1000))
 
 
@@ -306,8 +317,8 @@ def cyberglove():
         s_port=s_port,
         samples_per_read=1,
         cal_path=None)
-    pipeline = Pipeline([Windower(1000)])
-    channel_names = ['DOF ' + str(i) for i in range(1, n_df+1)]
+    pipeline = Pipeline([Windower(1000, dtype=np.float32)])
+    channel_names = numbered_names(n_df, prefix='DOF ')
     run(dev, pipeline, channel_names=channel_names, yrange=(0, 200))
 
 
@@ -325,7 +336,7 @@ def tcpsocket():
         samples_per_read=1,
         precision=precision,
         timeout=3)
-    pipeline = Pipeline([Windower(25)])
+    pipeline = Pipeline([Windower(25, dtype=np.float32)])
     _ = Thread(
         target=_tcp_socket_streamer,
         args=(ip, port, array_len, precision),
@@ -347,13 +358,19 @@ def udpsocket():
         samples_per_read=1,
         precision=precision,
         timeout=None)
-    pipeline = Pipeline([Windower(25)])
+    pipeline = Pipeline([Windower(25, dtype=np.float32)])
     run(dev, pipeline, yrange=(-3, 3))
 
 
 def run(dev, pipeline=None, **kwargs):
     # run an experiment with just an oscilloscope task
-    Experiment(daq=dev, subject='test').run(Oscilloscope(pipeline, **kwargs))
+    run_many(dev, [Oscilloscope(pipeline, **kwargs)])
+
+
+def run_many(dev, tasks):
+    # run tasks in sequence -- the experiment sets up the Qt application and
+    # the device's DaqStream once and reuses them for each task
+    Experiment(daq=dev, subject='test').run(*tasks)
 
 
 def _tcp_socket_streamer(ip, port, array_len, precision):
@@ -390,6 +407,7 @@ if __name__ == '__main__':
         'rainbow': rainbow,
         'bar': bar,
         'polar': polar,
+        'sequence': sequence,
         'keyboard': keyboard,
         'keystick': keystick,
         'emgsim': emgsim,
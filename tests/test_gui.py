@@ -4,7 +4,7 @@ from PyQt5 import QtCore, QtWidgets
 import numpy as np
 from axopy import util
 from axopy.gui.main import _MainWindow, Container, _SessionConfig
-from axopy.gui.graph import SignalWidget, BarWidget
+from axopy.gui.graph import SignalWidget, BarWidget, numbered_names
 from axopy.gui.canvas import Canvas, Circle, Cross, Line, Text, Rectangle
 
 
@@ -105,6 +105,14 @@ def test_container():
     c.set_widget(QtWidgets.QWidget())
 
 
+def test_numbered_names():
+    names = numbered_names(3)
+    assert names == ('Ch 1', 'Ch 2', 'Ch 3')
+    # same names are cached
+    assert numbered_names(3) is names
+    assert numbered_names(2, prefix='EMG ', start=0) == ('EMG 0', 'EMG 1')
+
+
 def test_signal_widget():
     w = SignalWidget()
 
@@ -129,6 +137,22 @@ def test_bar_widget():
     assert w.groups == 5
 
 
+def test_bar_widget_set_heights():
+    w = BarWidget()
+
+    w.set_heights(np.random.randn(4))
+    assert w.n_channels == 4
+    assert w.n_groups == 1
+
+    heights = np.random.randn(4)
+    w.set_heights(heights)
+    np.testing.assert_array_equal(w.plot_items[0].opts['height'], heights)
+
+    # adjusts to a different number of channels
+    w.set_heights(np.random.randn(6, 1))
+    assert w.n_channels == 6
+
+
 def test_canvas():
     c = Canvas()
     c.add_item(Circle(0.1))
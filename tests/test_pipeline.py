@@ -1,9 +1,13 @@
+import sys
+import copy
+import pickle
+import importlib
 import pytest
 import numpy as np
 from scipy import signal
 
 from numpy.testing import (assert_array_equal, assert_array_almost_equal,
-                           assert_equal)
+                           assert_equal, assert_allclose)
 
 import axopy.pipeline as pipeline
 from axopy.features.classes import _FeatureBase
@@ -301,6 +305,50 @@ def test_hooks():
     assert result == _g(_f(data))
 
 
+def test_hooks_added_later():
+    # hooks appended after the pipeline is built still run
+    calls = []
+    a = _FBlock()
+    p = pipeline.Pipeline([a, _GBlock()])
+    a.hooks.append(calls.append)
+
+    p.process(data)
+    assert calls == [_f(data)]
+
+
+def test_set_blocks():
+    # changing the blocks of a pipeline updates its structure
+    a = _FBlock()
+    b = _GBlock()
+    p = pipeline.Pipeline([a])
+    assert p.process(data) == _f(data)
+
+    p.blocks = [a, _NamedBlock(name='named'), (a, b)]
+    assert 'named' in p.named_blocks
+    p.blocks = [(a, b), _TwoIn()]
+    assert p.process(data) == _twoin(_f(data), _g(data))
+
+    # editing the original structure or a copy of it doesn't affect the
+    # pipeline, so its blocks always match what it processes
+    blocks = [a]
+    p.blocks = blocks
+    blocks.append(b)
+    p.blocks.append(b)
+    assert p.blocks == [a]
+    assert p.process(data) == _f(data)
+
+
+def test_pipeline_copy():
+    # copies of a pipeline process with their own blocks
+    windower = pipeline.Windower(10)
+    p = pipeline.Pipeline([windower, _FBlock()])
+
+    for p2 in (pickle.loads(pickle.dumps(p)), copy.deepcopy(p)):
+        out = p2.process(rand_data_2d[:, :5])
+        assert_array_equal(out, _f(p2.named_blocks['Windower']._store.read()))
+        assert windower._store is None
+
+
 def test_block_access():
     # test access to blocks in a pipeline using `named_blocks`.
     a = _NamedBlock(name='a')
@@ -358,6 +406,114 @@ def test_callable_block_with_args():
     assert a.process(3) == (42, 10)
 
 
+def test_callable_block_dtype():
+    a = pipeline.Callable(lambda x: 2 * x, dtype=np.float32)
+    out = a.process(rand_data_2d)
+    assert out.dtype == np.float32
+    assert_array_almost_equal(out, 2 * rand_data_2d)
+
+
+def test_numba_callable_block():
+    from axopy.pipeline.kernels import mean_scale, absolute
+
+    a = pipeline.NumbaCallable(mean_scale, (5, 1), func_args=(3.,))
+    assert a.name == 'mean_scale'
+    out = a.process(rand_data_2d)
+    assert_array_almost_equal(out, 3 * np.mean(rand_data_2d, axis=1,
+                                               keepdims=True))
+    # output is written into the same preallocated array each time
+    assert a.process(rand_data_2d) is out
+
+    a = pipeline.NumbaCallable(absolute, rand_data_2d.shape)
+    assert_array_equal(a.process(rand_data_2d - 0.5),
+                       np.abs(rand_data_2d - 0.5))
+
+
+def test_numba_mean_noise_kernel():
+    from axopy.pipeline.kernels import mean_noise
+
+    a = pipeline.NumbaCallable(mean_noise, (5, 20), func_args=(2.,))
+    out = a.process(np.zeros((5, 10)))
+    assert out.shape == (5, 20)
+    assert_array_equal(out, 0)
+
+
+def test_numba_callable_shape_mismatch():
+    from axopy.pipeline.kernels import mean_scale, absolute, mean_noise
+
+    a = pipeline.NumbaCallable(mean_scale, (2, 1), func_args=(1.,))
+    with pytest.raises(ValueError):
+        a.process(np.ones((50, 3)))
+
+    # the kernels check their output array themselves too
+    with pytest.raises(ValueError):
+        mean_scale(np.ones((50, 3)), 1., np.empty((2, 1)))
+    with pytest.raises(ValueError):
+        mean_scale(np.ones((2, 3)), 1., np.empty((2, 3)))
+    with pytest.raises(ValueError):
+        absolute(np.ones((2, 3)), np.empty((2, 2)))
+    with pytest.raises(ValueError):
+        mean_noise(np.ones((3, 3)), 1., np.empty((2, 10)))
+
+
+def test_numba_kernels_fallback(monkeypatch):
+    # the NumPy implementations are used when numba can't be imported
+    from axopy.pipeline import kernels
+
+    monkeypatch.setitem(sys.modules, 'numba', None)
+    try:
+        importlib.reload(kernels)
+        assert kernels.numba is None
+        assert kernels.mean_scale.__name__ == 'mean_scale'
+
+        out = np.empty((5, 1))
+        kernels.mean_scale(rand_data_2d, 3., out)
+        assert_array_almost_equal(out, 3 * np.mean(rand_data_2d, axis=1,
+                                                   keepdims=True))
+
+        out = np.empty(rand_data_2d.shape)
+        kernels.absolute(rand_data_2d - 0.5, out)
+        assert_array_equal(out, np.abs(rand_data_2d - 0.5))
+
+        out = np.empty((5, 20))
+        kernels.mean_noise(np.zeros((5, 10)), 2., out)
+        assert_array_equal(out, 0)
+
+        with pytest.raises(ValueError):
+            kernels.absolute(rand_data_2d[:1], out)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(kernels)
+
+
+def test_numba_kernels_compiled():
+    # with numba installed, the kernels are jitted versions of the loops
+    pytest.importorskip('numba')
+    from axopy.pipeline import kernels
+
+    for kernel in (kernels.mean_scale, kernels.absolute, kernels.mean_noise):
+        assert hasattr(kernel, 'py_func')
+
+
+def test_ufunc_block():
+    a = pipeline.UFunc(np.abs)
+    assert a.name == 'absolute'
+
+    x = rand_data_2d - 0.5
+    out = a.process(x)
+    assert_array_equal(out, np.abs(x))
+    # output array is reused for input of the same shape
+    assert a.process(-x) is out
+    assert_array_equal(out, np.abs(x))
+
+    # a new output array is allocated if the input changes
+    assert_array_equal(a.process(np.array([-1, 2])), np.array([1, 2]))
+
+    # scalar input also reuses its output
+    assert a.process(-3) == 3
+    assert a.process(-4) == 4
+
+
 #
 # axopy.pipeline.common tests
 #
@@ -411,6 +567,123 @@ def test_windower_overlap():
     assert_array_equal(win, data[:, -13:])
 
 
+def test_windower_wraparound():
+    # input lengths that don't divide the window length evenly
+    data = rand_data_2d
+    windower = pipeline.Windower(7)
+
+    # there's nothing to view before the first call to process
+    with pytest.raises(ValueError):
+        windower.views()
+
+    for start, stop in [(0, 7), (7, 8), (8, 15), (15, 16), (16, 23)]:
+        win = windower.process(data[:, start:stop])
+        assert_array_equal(win, data[:, stop-7:stop])
+
+        older, newer = windower.views()
+        assert_array_equal(np.concatenate((older, newer), axis=1), win)
+
+    windower.clear()
+    with pytest.raises(ValueError):
+        windower.views()
+
+
+def test_mean_window():
+    # same output as windowing then taking the mean
+    data = rand_data_2d
+    block = pipeline.MeanWindow(13, scale=3.)
+    windower = pipeline.Windower(13)
+
+    for samp in _window_generator(data, 6):
+        out = block.process(samp)
+        win = windower.process(samp)
+        assert_array_almost_equal(out, 3 * np.mean(win, axis=1,
+                                                   keepdims=True))
+
+    with pytest.raises(ValueError):
+        block.process(rand_data_2d1[:, :5])
+
+    block.clear()
+    block.process(rand_data_2d1[:, :5])
+
+
+def test_running_stats():
+    # same output as windowing then computing the statistic
+    data = rand_data_2d - 0.5
+    blocks = [(pipeline.RunningRMS(13),
+               lambda w: np.sqrt(np.mean(w**2, axis=1, keepdims=True))),
+              (pipeline.RunningVar(13),
+               lambda w: np.var(w, axis=1, keepdims=True))]
+
+    for block, func in blocks:
+        windower = pipeline.Windower(13)
+        for samp in _window_generator(data, 6):
+            out = block.process(samp)
+            assert_array_almost_equal(out, func(windower.process(samp)))
+
+
+def test_running_var_float32_offset():
+    # float32 input with a large offset doesn't lose the variance
+    data = (1e4 + np.random.randn(2, 1000)).astype(np.float32)
+    block = pipeline.RunningVar(500)
+    windower = pipeline.Windower(500)
+    for i, samp in enumerate(_window_generator(data, 50)):
+        out = block.process(samp)
+        win = windower.process(samp)
+        if i >= 10:
+            assert_allclose(out, np.var(win, axis=1, keepdims=True),
+                            rtol=1e-4)
+
+
+def test_circular_store():
+    store = pipeline.CircularStore(2, 5)
+    replaced = []
+
+    def on_replace(old, new):
+        replaced.append((old.copy(), new.copy()))
+
+    assert not store.write(np.ones((2, 3)))
+    assert store.write(2 * np.ones((2, 3)), on_replace=on_replace)
+    # write wraps around the end of the buffer in two pieces
+    assert len(replaced) == 2
+    assert_array_equal(replaced[0][0], np.zeros((2, 2)))
+    assert_array_equal(replaced[1][0], np.ones((2, 1)))
+
+    assert_array_equal(store.read(), [[1, 1, 2, 2, 2], [1, 1, 2, 2, 2]])
+    assert store.head == 1
+
+
+def test_gaussian_modulator():
+    amp = np.array([[0.], [1.], [2.]])
+    block = pipeline.GaussianModulator(50, gain=2., seed=0)
+    out = block.process(amp)
+    assert out.shape == (3, 50)
+    assert out.dtype == np.float32
+    assert_array_equal(out[0], 0)
+
+    truth = 2 * amp * np.random.default_rng(0).standard_normal(
+        (3, 50), dtype=np.float32)
+    assert_array_almost_equal(out, truth)
+
+    # output is filled in place
+    assert block.process(amp) is out
+
+    # changing the number of channels requires clearing first
+    for n in (1, 2):
+        with pytest.raises(ValueError):
+            block.process(amp[:n])
+
+    block.clear()
+    assert block.process(amp[:2]).shape == (2, 50)
+
+
+def test_windower_dtype():
+    windower = pipeline.Windower(13, dtype=np.float32)
+    win = windower.process(rand_data_2d[:, :10])
+    assert win.dtype == np.float32
+    assert_array_almost_equal(win[:, -10:], rand_data_2d[:, :10])
+
+
 def test_windower_1d():
     # make sure a 1D array raises an error
     data = np.array([1, 2, 3, 4])
@@ -484,6 +757,32 @@ def test_fir_filter():
     block.process(data)
 
 
+def test_filter_continuous():
+    # filtering consecutive chunks is the same as filtering all data at once
+    data = rand_data_2d
+    for b_, a_ in [(b, a), (b, 1), (2 * b, 2 * a)]:
+        block = pipeline.Filter(b_, a_)
+        out = np.hstack([block.process(samp)
+                         for samp in _window_generator(data, 7)])
+        assert_array_almost_equal(out, signal.lfilter(b_, a_, data, axis=-1))
+
+        block.clear()
+        assert_array_almost_equal(block.process(data[:, :7]), out[:, :7])
+
+
+def test_fir_filter_overlap():
+    # FIR path matches filtering the whole signal when inputs overlap
+    data = rand_data_2d
+    win_length = 10
+    overlap = 4
+    block = pipeline.Filter(b, overlap=overlap)
+    truth = signal.lfilter(b, 1, data, axis=-1)
+
+    for start in range(0, 50, win_length-overlap):
+        out = block.process(data[:, start:start+win_length])
+        assert_array_almost_equal(out, truth[:, start:start+win_length])
+
+
 def test_fextractor_simple():
     f0 = _NthSampleFeature(0)
     ex = pipeline.FeatureExtractor([('0', f0),
@@ -609,6 +908,20 @@ def test_ensure2d_col():
     assert_array_equal(truth, b.process(data))
 
 
+def test_ensure2d_contiguous():
+    # output is C-contiguous even if the input isn't
+    data = rand_data_2d[:, ::2]
+    for orientation in ['row', 'col']:
+        out = pipeline.Ensure2D(orientation=orientation).process(data)
+        assert out.flags['C_CONTIGUOUS']
+
+    assert_array_equal(pipeline.Ensure2D('col').process(data), data.T)
+
+    out = pipeline.Ensure2D(dtype=np.float32).process(rand_data_1d)
+    assert out.dtype == np.float32
+    assert out.shape == (1, rand_data_1d.size)
+
+
 def test_estimator():
     class FakeEstimator(object):
 
@@ -637,6 +950,23 @@ def test_transformer():
     block.process(0)
 
 
+def test_plot_decimator():
+    data = rand_data_2d
+    block = pipeline.PlotDecimator(target_points=30)
+    out = block.process(data)
+    assert_array_equal(out, data[:, ::4])
+    assert out.shape[-1] <= 30
+    assert np.shares_memory(out, data)
+
+    # the target is an upper bound, even just below a multiple of it
+    block = pipeline.PlotDecimator(target_points=2000)
+    assert block.process(np.zeros((1, 3999))).shape == (1, 2000)
+    assert block.process(np.zeros((1, 4001))).shape == (1, 1334)
+
+    # shorter input than the target is passed through
+    assert_array_equal(block.process(data[:, :20]), data[:, :20])
+
+
 def test_minmaxscaler():
     data = rand_data_2d
     min_ = np.min(data, axis=-1)
@@ -1,6 +1,6 @@
 import pytest
 from axopy import util
-from axopy.task import Task
+from axopy.task import Task, Oscilloscope
 from axopy.task.base import _TaskIter
 from axopy.messaging import Transmitter
 
@@ -119,3 +119,28 @@ def test_task_transmitters():
     assert count == 4
 
     t2.disconnect_all()
+
+
+def test_oscilloscope_max_rate(mocker):
+    """Oscilloscope only redraws at the maximum rate."""
+    class FakeScope(object):
+        def __init__(self):
+            self.n_plots = 0
+
+        def plot(self, data):
+            self.n_plots += 1
+
+    clock = mocker.patch('axopy.task.common.time.perf_counter')
+
+    osc = Oscilloscope(max_rate=10.)
+    osc.scope = FakeScope()
+    for t in [0., 0.05, 0.09, 0.1, 0.15, 0.25]:
+        clock.return_value = t
+        osc.update(None)
+    assert osc.scope.n_plots == 3
+
+    osc = Oscilloscope(max_rate=None)
+    osc.scope = FakeScope()
+    for i in range(5):
+        osc.update(None)
+    assert osc.scope.n_plots == 5